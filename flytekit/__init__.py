@@ -309,6 +309,9 @@ def load_implicit_plugins():
 
     """
     discovered_plugins = entry_points(group="flytekit.plugins")
+    # Plugins are loaded serially on purpose. This runs while flytekit itself is still being imported, so a plugin
+    # loaded from another thread would block on flytekit's module lock as soon as it imports from flytekit.
+    # Keep plugin __init__ files cheap (lazy imports) instead.
     for p in discovered_plugins:
         p.load()
 
@@ -3,6 +3,7 @@ import os
 import sys
 import typing
 from contextlib import suppress
+from functools import lru_cache
 
 from flytekit.core.constants import FLYTE_INTERNAL_IMAGE_ENV_VAR
 
@@ -55,6 +56,7 @@ class DefaultImages(object):
         )
 
     @classmethod
+    @lru_cache
     def get_version_suffix(cls) -> str:
         from flytekit import __version__
 
@@ -0,0 +1,34 @@
+import importlib
+import sys
+import typing
+
+
+def lazy_import_all(
+    package: str, submodule: str, names: typing.List[str]
+) -> typing.Tuple[typing.Callable[[str], typing.Any], typing.Callable[[], typing.List[str]], typing.List[str]]:
+    """
+    This function is used to lazily re-export names from a submodule of a package, so that importing the package
+    does not import the submodule and its dependencies. It is used in the package's ``__init__.py`` as follows:
+    .. code-block:: python
+        from flytekit.lazy_import.lazy_all import lazy_import_all
+        __getattr__, __dir__, __all__ = lazy_import_all(__name__, ".renderer", ["BoxRenderer", "TableRenderer"])
+    :param Text package: The name of the package re-exporting the names, usually ``__name__``
+    :param Text submodule: The (relative) name of the submodule defining the names
+    :param names: The names to re-export
+    :return: A module-level ``__getattr__`` and ``__dir__`` (PEP 562) and the list of names to use as ``__all__``
+    """
+    lazy_names = frozenset(names)
+
+    def __getattr__(name: str) -> typing.Any:
+        if name in lazy_names:
+            module = importlib.import_module(submodule, package)
+            value = getattr(module, name)
+            # Cache the value on the package, so that this hook only runs once per name
+            sys.modules[package].__dict__[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> typing.List[str]:
+        return sorted(set(sys.modules[package].__dict__) | lazy_names)
+
+    return __getattr__, __dir__, list(names)
@@ -1,3 +1,4 @@
+import functools
 import importlib.util
 import sys
 import types
@@ -5,13 +6,43 @@ import types
 LAZY_MODULES = []
 
 
+def _find_spec(module_name: str):
+    try:
+        return importlib.util.find_spec(module_name)
+    except ModuleNotFoundError:
+        # find_spec imports the parent package of a submodule, which fails if the parent is not installed either.
+        return None
+
+
 class LazyModule(types.ModuleType):
+    """
+    Stand-in for a module that was not installed when it was requested through lazy_module. The module is looked up
+    again and imported on the first attribute access, which raises an ImportError if it is still not installed.
+    """
+
     def __init__(self, module_name: str):
         super().__init__(module_name)
-        self._module_name = module_name
+        object.__setattr__(self, "_module_name", module_name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self) -> types.ModuleType:
+        module = object.__getattribute__(self, "_module")
+        if module is None:
+            module_name = object.__getattribute__(self, "_module_name")
+            if _find_spec(module_name) is None:
+                raise ImportError(f"Module {module_name} is not yet installed.")
+            module = importlib.import_module(module_name)
+            object.__setattr__(self, "_module", module)
+        return module
 
     def __getattribute__(self, attr):
-        raise ImportError(f"Module {object.__getattribute__(self, '_module_name')} is not yet installed.")
+        return getattr(LazyModule._load(self), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(LazyModule._load(self), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(LazyModule._load(self), attr)
 
 
 def is_imported(module_name):
@@ -21,6 +52,7 @@ def is_imported(module_name):
     return module_name in sys.modules and module_name not in LAZY_MODULES
 
 
+@functools.lru_cache(maxsize=None)
 def lazy_module(fullname):
     """
     This function is used to lazily import modules.  It is used in the following way:
@@ -28,16 +60,19 @@ def lazy_module(fullname):
         from flytekit.lazy_import import lazy_module
         sklearn = lazy_module("sklearn")
         sklearn.svm.SVC()
+    Results are cached per module name, so every call site shares a single module object and
+    ``importlib.util.find_spec`` only runs once per module.
     :param Text fullname: The full name of the module to import
     """
     if fullname in sys.modules:
         return sys.modules[fullname]
     # https://docs.python.org/3/library/importlib.html#implementing-lazy-imports
-    spec = importlib.util.find_spec(fullname)
+    spec = _find_spec(fullname)
     if spec is None or spec.loader is None:
         # Return a lazy module if the module is not found in the python environment,
         # so that we can raise a proper error when the user tries to access an attribute in the module.
         return LazyModule(fullname)
+    # Installed modules are registered in sys.modules right away and only executed on first attribute access.
     loader = importlib.util.LazyLoader(spec.loader)
     spec.loader = loader
     module = importlib.util.module_from_spec(spec)
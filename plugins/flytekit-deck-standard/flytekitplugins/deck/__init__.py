@@ -9,9 +9,39 @@ This package contains things that are useful when extending Flytekit.
 
    BoxRenderer
    FrameProfilingRenderer
-   MarkdownRenderer
+   GanttChartRenderer
    ImageRenderer
+   MarkdownRenderer
+   SourceCodeRenderer
    TableRenderer
 """
 
-from .renderer import BoxRenderer, FrameProfilingRenderer, ImageRenderer, MarkdownRenderer, TableRenderer
+import importlib
+
+__all__ = [
+    "BoxRenderer",
+    "FrameProfilingRenderer",
+    "GanttChartRenderer",
+    "ImageRenderer",
+    "MarkdownRenderer",
+    "SourceCodeRenderer",
+    "TableRenderer",
+]
+
+# The renderers pull in pandas, plotly, markdown, etc. This package is loaded through the flytekit.plugins
+# entry point on every `import flytekit`, so the renderers are only imported when they are first referenced.
+# This is not built on flytekit.lazy_import.lazy_all, so that the plugin keeps working with older flytekit releases.
+_LAZY = {name: "renderer" for name in __all__}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        mod = importlib.import_module(f".{_LAZY[name]}", __name__)
+        val = getattr(mod, name)
+        globals()[name] = val
+        return val
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
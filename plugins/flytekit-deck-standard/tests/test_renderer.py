@@ -1,4 +1,6 @@
 import datetime
+import subprocess
+import sys
 import tempfile
 
 import markdown
@@ -98,3 +100,25 @@ def test_source_code_renderer():
     # Assert that the color #ffffff is used instead of #fff0f0
     assert "#ffffff" in result
     assert "#fff0f0" not in result
+
+
+def test_lazy_renderer_import():
+    import flytekitplugins.deck as deck
+    from flytekitplugins.deck import renderer
+
+    assert deck.BoxRenderer is renderer.BoxRenderer
+    assert deck.GanttChartRenderer is renderer.GanttChartRenderer
+    assert "TableRenderer" in deck.__all__
+    assert "TableRenderer" in dir(deck)
+    with pytest.raises(AttributeError):
+        deck.NotARenderer
+
+
+def test_deck_import_does_not_import_renderers():
+    # Run in a fresh interpreter, since this module already imports the renderers and their dependencies.
+    code = (
+        "import sys, flytekitplugins.deck; "
+        "print([m for m in ('flytekitplugins.deck.renderer', 'pandas', 'plotly') if m in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -1,3 +1,4 @@
+import html
 import typing
 
 from flytekit import FlyteContext, lazy_module
@@ -12,7 +13,6 @@ from flytekit.types.structured.structured_dataset import (
     StructuredDatasetTransformerEngine,
 )
 
-pd = lazy_module("pandas")
 pyspark = lazy_module("pyspark")
 ps_dataframe = lazy_module("pyspark.sql.dataframe")
 DataFrame = ps_dataframe.DataFrame
@@ -25,7 +25,8 @@ class SparkDataFrameRenderer:
 
     def to_html(self, df: DataFrame) -> str:
         assert isinstance(df, DataFrame)
-        return pd.DataFrame(df.schema, columns=["StructField"]).to_html()
+        rows = "".join(f"<tr><td>{html.escape(str(field))}</td></tr>" for field in df.schema.fields)
+        return f'<table border="1"><thead><tr><th>StructField</th></tr></thead><tbody>{rows}</tbody></table>'
 
 
 class SparkToParquetEncodingHandler(StructuredDatasetEncoder):
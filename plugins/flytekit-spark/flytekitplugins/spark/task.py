@@ -1,6 +1,9 @@
+import copy
+import functools
+import json
 import os
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Union, cast
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
 
 from google.protobuf.json_format import MessageToDict
 
@@ -61,6 +64,17 @@ class Databricks(Spark):
     databricks_instance: Optional[str] = None
 
 
+# Serialization defaults for locally created sessions. Kryo and zstd are considerably cheaper than Spark's
+# JavaSerializer/lz4 defaults for shuffles; any of these can be overridden through the spark conf.
+DEFAULT_SPARK_CONF = {
+    "spark.serializer": "org.apache.spark.serializer.KryoSerializer",
+    "spark.kryo.registrationRequired": "false",
+    "spark.kryoserializer.buffer.max": "128m",
+    "spark.io.compression.codec": "zstd",
+    "spark.io.compression.zstd.level": "1",
+}
+
+
 # This method does not reset the SparkSession since it's a bit hard to handle multiple
 # Spark sessions in a single application as it's described in:
 # https://stackoverflow.com/questions/41491972/how-can-i-tear-down-a-sparksession-and-create-a-new-one-within-one-application.
@@ -82,7 +96,7 @@ def new_spark_session(name: str, conf: Dict[str, str] = None):
         # Add system spark-conf for local/notebook based execution.
         sess_builder = sess_builder.master("local[*]")
         spark_conf = _pyspark.SparkConf()
-        for k, v in conf.items():
+        for k, v in {**DEFAULT_SPARK_CONF, **conf}.items():
             spark_conf.set(k, v)
         spark_conf.set("spark.driver.bindAddress", "127.0.0.1")
         # In local execution, propagate PYTHONPATH to executors too. This makes the spark
@@ -100,6 +114,32 @@ def new_spark_session(name: str, conf: Dict[str, str] = None):
     # sess.stop()
 
 
+@functools.lru_cache(maxsize=256)
+def _serialize_spark_job(
+    spark_conf: Tuple[Tuple[str, str], ...],
+    hadoop_conf: Tuple[Tuple[str, str], ...],
+    application_file: str,
+    executor_path: str,
+    databricks_conf: Optional[str],
+    databricks_instance: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Builds the serialized SparkJob. The arguments are hashable so that tasks sharing the same spark config are only
+    serialized once; callers must not mutate the returned dict.
+    """
+    job = SparkJob(
+        spark_conf=dict(spark_conf),
+        hadoop_conf=dict(hadoop_conf),
+        application_file=application_file,
+        executor_path=executor_path,
+        main_class="",
+        spark_type=SparkType.PYTHON,
+        databricks_conf=json.loads(databricks_conf) if databricks_conf is not None else None,
+        databricks_instance=databricks_instance,
+    )
+    return MessageToDict(job.to_flyte_idl())
+
+
 class PysparkFunctionTask(AsyncAgentExecutorMixin, PythonFunctionTask[Spark]):
     """
     Actual Plugin that transforms the local python code for execution within a spark context
@@ -143,20 +183,22 @@ class PysparkFunctionTask(AsyncAgentExecutorMixin, PythonFunctionTask[Spark]):
         return get_registerable_container_image(self.container_image, settings.image_config)
 
     def get_custom(self, settings: SerializationSettings) -> Dict[str, Any]:
-        job = SparkJob(
-            spark_conf=self.task_config.spark_conf,
-            hadoop_conf=self.task_config.hadoop_conf,
-            application_file=self._default_applications_path or "local://" + settings.entrypoint_settings.path,
-            executor_path=self._default_executor_path or settings.python_interpreter,
-            main_class="",
-            spark_type=SparkType.PYTHON,
-        )
+        databricks_conf = None
+        databricks_instance = None
         if isinstance(self.task_config, Databricks):
             cfg = cast(Databricks, self.task_config)
-            job._databricks_conf = cfg.databricks_conf
-            job._databricks_instance = cfg.databricks_instance
+            databricks_conf = json.dumps(cfg.databricks_conf, sort_keys=True) if cfg.databricks_conf else None
+            databricks_instance = cfg.databricks_instance
 
-        return MessageToDict(job.to_flyte_idl())
+        custom = _serialize_spark_job(
+            spark_conf=tuple(sorted(self.task_config.spark_conf.items())),
+            hadoop_conf=tuple(sorted(self.task_config.hadoop_conf.items())),
+            application_file=self._default_applications_path or "local://" + settings.entrypoint_settings.path,
+            executor_path=self._default_executor_path or settings.python_interpreter,
+            databricks_conf=databricks_conf,
+            databricks_instance=databricks_instance,
+        )
+        return copy.deepcopy(custom)
 
     def pre_execute(self, user_params: ExecutionParameters) -> ExecutionParameters:
         import pyspark as _pyspark
@@ -168,7 +210,7 @@ class PysparkFunctionTask(AsyncAgentExecutorMixin, PythonFunctionTask[Spark]):
             # Add system spark-conf for local/notebook based execution.
             spark_conf = _pyspark.SparkConf()
             spark_conf.set("spark.driver.bindAddress", "127.0.0.1")
-            for k, v in self.task_config.spark_conf.items():
+            for k, v in {**DEFAULT_SPARK_CONF, **self.task_config.spark_conf}.items():
                 spark_conf.set(k, v)
             # In local execution, propagate PYTHONPATH to executors too. This makes the spark
             # execution hermetic to the execution environment. For example, it allows running
@@ -1,9 +1,9 @@
-import pandas as pd
-import pyspark
+from unittest import mock
+
 import pytest
 from flytekitplugins.spark import Spark
-from flytekitplugins.spark.task import Databricks, new_spark_session
-from pyspark.sql import SparkSession
+from flytekitplugins.spark.models import SparkJob
+from flytekitplugins.spark.task import DEFAULT_SPARK_CONF, Databricks, _serialize_spark_job, new_spark_session
 
 import flytekit
 from flytekit import StructuredDataset, StructuredDatasetTransformerEngine, task
@@ -13,9 +13,17 @@ from flytekit.core.context_manager import ExecutionParameters, FlyteContextManag
 
 @pytest.fixture(scope="function")
 def reset_spark_session() -> None:
-    pyspark.sql.SparkSession.builder.getOrCreate().stop()
+    _stop_spark_session()
     yield
-    pyspark.sql.SparkSession.builder.getOrCreate().stop()
+    _stop_spark_session()
+
+
+def _stop_spark_session():
+    # getOrCreate() would boot a JVM only to stop it when no session exists yet.
+    pyspark = pytest.importorskip("pyspark")
+    sess = getattr(pyspark.sql.SparkSession, "_instantiatedSession", None)
+    if sess is not None:
+        sess.stop()
 
 
 def test_spark_task(reset_spark_session):
@@ -74,9 +82,11 @@ def test_spark_task(reset_spark_session):
     assert new_p.has_attr("SPARK_SESSION")
 
     assert my_spark.sess is not None
-    configs = my_spark.sess.sparkContext.getConf().getAll()
-    assert ("spark", "1") in configs
-    assert ("spark.app.name", "FlyteSpark: ex:local:local:local") in configs
+    configs = dict(my_spark.sess.sparkContext.getConf().getAll())
+    assert configs["spark"] == "1"
+    assert configs["spark.serializer"] == DEFAULT_SPARK_CONF["spark.serializer"]
+    assert configs["spark.io.compression.codec"] == "zstd"
+    assert configs["spark.app.name"] == "FlyteSpark: ex:local:local:local"
 
     databricks_instance = "account.cloud.databricks.com"
 
@@ -96,25 +106,65 @@ def test_spark_task(reset_spark_session):
     assert my_databricks.task_config.spark_conf == {"spark": "2"}
     assert my_databricks.task_config.databricks_conf == databricks_conf
     assert my_databricks.task_config.databricks_instance == databricks_instance
+
+    retrieved_settings = my_databricks.get_custom(settings)
+    assert retrieved_settings["sparkConf"] == {"spark": "2"}
+    assert retrieved_settings["databricksConf"] == databricks_conf
+    assert retrieved_settings["databricksConf"]["new_cluster"]["num_workers"] == 4
+    assert retrieved_settings["databricksInstance"] == databricks_instance
     assert my_databricks(a=3) == 3
 
 
+def test_get_custom_is_cached():
+    _serialize_spark_job.cache_clear()
+
+    @task(task_config=Spark(spark_conf={"spark.cached": "1"}))
+    def my_spark(a: str) -> int:
+        return 10
+
+    default_img = Image(name="default", fqn="test", tag="tag")
+    settings = SerializationSettings(
+        project="project",
+        domain="domain",
+        version="version",
+        image_config=ImageConfig(default_image=default_img, images=[default_img]),
+    )
+
+    with mock.patch("flytekitplugins.spark.task.SparkJob", wraps=SparkJob) as mock_spark_job:
+        first = my_spark.get_custom(settings)
+        first["sparkConf"]["spark.cached"] = "2"
+        second = my_spark.get_custom(settings)
+        mock_spark_job.assert_called_once()
+
+    assert second["sparkConf"] == {"spark.cached": "1"}
+
+
 def test_new_spark_session():
     name = "SessionName"
-    spark_conf = {"spark1": "1", "spark2": "2"}
+    spark_conf = {"spark1": "1", "spark2": "2", "spark.io.compression.codec": "lz4"}
     new_sess = new_spark_session(name, spark_conf)
-    configs = new_sess.sparkContext.getConf().getAll()
+    configs = dict(new_sess.sparkContext.getConf().getAll())
     assert new_sess is not None
-    assert ("spark.driver.bindAddress", "127.0.0.1") in configs
-    assert ("spark.master", "local[*]") in configs
-    assert ("spark1", "1") in configs
-    assert ("spark2", "2") in configs
+    assert configs["spark.driver.bindAddress"] == "127.0.0.1"
+    assert configs["spark.master"] == "local[*]"
+    assert configs["spark1"] == "1"
+    assert configs["spark2"] == "2"
+    assert configs["spark.serializer"] == DEFAULT_SPARK_CONF["spark.serializer"]
+    assert configs["spark.kryoserializer.buffer.max"] == "128m"
+    assert configs["spark.io.compression.codec"] == "lz4"
 
 
 def test_to_html():
-    spark = SparkSession.builder.getOrCreate()
-    df = spark.createDataFrame([("Bob", 10)], ["name", "age"])
+    pyspark = pytest.importorskip("pyspark")
+    spark = pyspark.sql.SparkSession.builder.getOrCreate()
+    df = spark.createDataFrame([("Bob", 10)], ["name", "a<b"])
     sd = StructuredDataset(dataframe=df)
     tf = StructuredDatasetTransformerEngine()
     output = tf.to_html(FlyteContextManager.current_context(), sd, pyspark.sql.DataFrame)
-    assert pd.DataFrame(df.schema, columns=["StructField"]).to_html() == output
+    assert output.startswith('<table border="1"><thead><tr><th>StructField</th></tr></thead><tbody><tr><td>')
+    assert output.endswith("</td></tr></tbody></table>")
+    assert output.count("<tr><td>") == 2
+    assert "name" in output
+    # The exact StructField repr depends on the pyspark version, but field names must be escaped.
+    assert "a&lt;b" in output
+    assert "a<b" not in output
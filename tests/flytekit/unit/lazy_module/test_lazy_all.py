@@ -0,0 +1,21 @@
+import decimal
+import sys
+import types
+
+import pytest
+
+from flytekit.lazy_import.lazy_all import lazy_import_all
+
+
+def test_lazy_import_all(monkeypatch):
+    package = types.ModuleType("lazy_package")
+    monkeypatch.setitem(sys.modules, "lazy_package", package)
+
+    getattr_, dir_, all_ = lazy_import_all("lazy_package", "decimal", ["Decimal"])
+    assert all_ == ["Decimal"]
+    assert "Decimal" in dir_()
+    assert "Decimal" not in package.__dict__
+    assert getattr_("Decimal") is decimal.Decimal
+    assert package.__dict__["Decimal"] is decimal.Decimal
+    with pytest.raises(AttributeError):
+        getattr_("Context")
@@ -1,6 +1,17 @@
+import sys
+
 import pytest
 
-from flytekit.lazy_import.lazy_module import LazyModule, lazy_module
+from flytekit.lazy_import.lazy_module import LAZY_MODULES, LazyModule, is_imported, lazy_module
+
+
+@pytest.fixture
+def unimported_tabnanny(monkeypatch):
+    monkeypatch.delitem(sys.modules, "tabnanny", raising=False)
+    lazy_module.cache_clear()
+    yield
+    LAZY_MODULES[:] = [m for m in LAZY_MODULES if m is not sys.modules.get("tabnanny")]
+    lazy_module.cache_clear()
 
 
 def test_lazy_module():
@@ -8,5 +19,28 @@ def test_lazy_module():
     assert mod.__name__ == "pyarrow"
     mod = lazy_module("fake_module")
     assert isinstance(mod, LazyModule)
+    assert lazy_module("fake_module") is mod
     with pytest.raises(ImportError, match="Module fake_module is not yet installed."):
         print(mod.attr)
+    with pytest.raises(ImportError, match="Module fake_module is not yet installed."):
+        mod.attr = 1
+
+
+def test_lazy_module_registers_installed_module(unimported_tabnanny):
+    mod = lazy_module("tabnanny")
+    assert sys.modules["tabnanny"] is mod
+    assert is_imported("tabnanny")
+    assert callable(mod.check)
+    assert not is_imported("fake_module.submodule")
+
+
+def test_lazy_module_proxy_forwards_attribute_writes(unimported_tabnanny):
+    mod = LazyModule("tabnanny")
+    mod.lazy_attr = 1
+    assert mod.lazy_attr == 1
+    assert sys.modules["tabnanny"].lazy_attr == 1
+    assert isinstance(mod, LazyModule)
+    del mod.lazy_attr
+    assert not hasattr(sys.modules["tabnanny"], "lazy_attr")
+    with pytest.raises(AttributeError):
+        mod.lazy_attr